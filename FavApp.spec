@@ -36,6 +36,7 @@ a = Analysis(
         'core',
         'core.config',
         'core.launcher',
+        'core.icon_cache',
         'core.app_finder',
         'core.autostart',
         'core.debug_logger',
@@ -44,6 +45,8 @@ a = Analysis(
         'gui.qt.main_window_qt',
         'gui.qt.dialogs_qt',
         'gui.qt.styles',
+        'gui.qt.delegates',
+        'gui.qt.resources',
     ],
     hookspath=[],
     hooksconfig={},
@@ -23,14 +23,8 @@ class AppFinder:
         apps.extend(AppFinder._scan_registry())
 
         # Scan common installation directories
-        common_dirs = [
-            os.path.join(os.environ.get("ProgramFiles", "C:\\Program Files"), "*"),
-            os.path.join(os.environ.get("ProgramFiles(x86)", "C:\\Program Files (x86)"), "*"),
-            os.path.join(os.environ.get("LOCALAPPDATA", ""), "Programs", "*"),
-        ]
-
-        for dir_pattern in common_dirs:
-            apps.extend(AppFinder._scan_directory(os.path.dirname(dir_pattern)))
+        for directory in AppFinder.get_scan_directories():
+            apps.extend(AppFinder._scan_directory(directory))
 
         # Remove duplicates based on path
         unique_apps = []
@@ -45,6 +39,15 @@ class AppFinder:
 
         return unique_apps
 
+    @staticmethod
+    def get_scan_directories() -> List[str]:
+        """Return the common installation directories scanned for executables."""
+        return [
+            os.environ.get("ProgramFiles", "C:\\Program Files"),
+            os.environ.get("ProgramFiles(x86)", "C:\\Program Files (x86)"),
+            os.path.join(os.environ.get("LOCALAPPDATA", ""), "Programs"),
+        ]
+
     @staticmethod
     def _scan_registry() -> List[Dict[str, str]]:
         """Scan Windows registry for installed applications."""
@@ -110,6 +110,11 @@ class ConfigManager:
         self.config[key] = value
         self.save()
 
+    def update_settings(self, **settings) -> None:
+        """Set several configuration settings with a single save."""
+        self.config.update(settings)
+        self.save()
+
     # Profile management
     def get_profiles(self) -> list[str]:
         """Get list of all profile names."""
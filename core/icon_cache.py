@@ -0,0 +1,100 @@
+"""Persistent icon cache for FavApp Starter."""
+
+import os
+import sqlite3
+import threading
+from typing import Optional
+
+
+class IconCache:
+    """Stores encoded app icons in SQLite so they survive restarts."""
+
+    def __init__(self, db_path: str):
+        """
+        Open (or create) the cache database.
+
+        Args:
+            db_path: Path of the SQLite file; the cache is disabled if it
+                cannot be opened
+        """
+        self.db_path = db_path
+        # Icons are read and written from thread pool workers
+        self._lock = threading.Lock()
+        try:
+            self._conn = sqlite3.connect(db_path, check_same_thread=False)
+            with self._conn:
+                self._conn.execute(
+                    "CREATE TABLE IF NOT EXISTS icons (key TEXT PRIMARY KEY, png BLOB)"
+                )
+        except sqlite3.Error:
+            self._conn = None
+
+    @staticmethod
+    def make_key(path: str, size: int) -> str:
+        """
+        Build the cache key for an app icon.
+
+        Args:
+            path: Path to the executable
+            size: Icon size in pixels
+
+        Returns:
+            Key from the normalized path, modification time and size, so an
+            updated executable gets a new entry
+        """
+        try:
+            mtime_ns = os.stat(path).st_mtime_ns
+        except OSError:
+            mtime_ns = 0
+        return f"{os.path.normcase(os.path.abspath(path))}:{mtime_ns}:{size}"
+
+    def get(self, key: str) -> Optional[bytes]:
+        """
+        Return the stored PNG data for a key, or None if there is none.
+
+        Empty data means the icon was looked up before and the app has none.
+        """
+        with self._lock:
+            if self._conn is None:
+                return None
+            try:
+                row = self._conn.execute(
+                    "SELECT png FROM icons WHERE key = ?", (key,)
+                ).fetchone()
+            except sqlite3.Error:
+                return None
+        return row[0] if row else None
+
+    def put(self, key: str, png: bytes):
+        """
+        Store the PNG data for a key.
+
+        Entries for older versions of the same executable (same path and
+        size, another modification time) are deleted, so the cache holds
+        one icon per app and size instead of growing with every update.
+        """
+        path, _, size = key.rsplit(":", 2)
+        prefix, suffix = f"{path}:", f":{size}"
+        with self._lock:
+            if self._conn is None:
+                return
+            try:
+                with self._conn:
+                    self._conn.execute(
+                        "DELETE FROM icons WHERE key != ? AND substr(key, 1, ?) = ? "
+                        "AND substr(key, -?) = ?",
+                        (key, len(prefix), prefix, len(suffix), suffix)
+                    )
+                    self._conn.execute(
+                        "INSERT OR REPLACE INTO icons (key, png) VALUES (?, ?)",
+                        (key, sqlite3.Binary(png))
+                    )
+            except sqlite3.Error:
+                pass
+
+    def close(self):
+        """Close the database; later lookups miss and stores are dropped."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
@@ -3,6 +3,7 @@
 import os
 import subprocess
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, Callable
 from PIL import Image
 import ctypes
@@ -70,10 +71,19 @@ class IconExtractor:
                 # log("Using LARGEICON flag")
 
             # log("Calling SHGetFileInfoW...")
-            result = shell32.SHGetFileInfoW(
-                path, 0, ctypes.byref(shinfo),
-                ctypes.sizeof(shinfo), flags
-            )
+            # SHGetFileInfoW needs COM initialized on the calling thread, and
+            # icons may be extracted on worker threads; each successful
+            # CoInitialize (S_OK or S_FALSE) is balanced by CoUninitialize
+            ole32 = ctypes.windll.ole32
+            com_initialized = ole32.CoInitialize(None) >= 0
+            try:
+                result = shell32.SHGetFileInfoW(
+                    path, 0, ctypes.byref(shinfo),
+                    ctypes.sizeof(shinfo), flags
+                )
+            finally:
+                if com_initialized:
+                    ole32.CoUninitialize()
 
             if result and shinfo.hIcon:
                 # log(f"✓ SHGetFileInfoW succeeded, hIcon: {shinfo.hIcon}")
@@ -272,6 +282,15 @@ class IconExtractor:
 class AppLauncher:
     """Handles launching Windows applications."""
 
+    # Started with CreateProcess directly; anything else (.lnk, .bat,
+    # .msc, ...) needs the shell to find its handler
+    DIRECT_EXTENSIONS = {".exe", ".com"}
+
+    # Characters cmd.exe interprets in the arguments (%VAR% expansion,
+    # command chaining, pipes, redirection, escapes); commands using any of
+    # them keep going through the shell so saved entries behave as before
+    SHELL_METACHARACTERS = frozenset("%&|<>^")
+
     @staticmethod
     def launch_app(path: str, arguments: str = "", working_dir: str = "") -> tuple[bool, Optional[str]]:
         """
@@ -301,11 +320,21 @@ class AppLauncher:
             # Set working directory
             cwd = working_dir if working_dir and os.path.isdir(working_dir) else os.path.dirname(path)
 
+            # Going through the shell costs an extra cmd.exe process per
+            # launch, so executables skip it unless their arguments rely on
+            # cmd's syntax
+            direct = (
+                os.name == "nt"
+                and os.path.splitext(path)[1].lower() in AppLauncher.DIRECT_EXTENSIONS
+                and AppLauncher.SHELL_METACHARACTERS.isdisjoint(arguments)
+            )
+
             # Launch with subprocess
             subprocess.Popen(
                 cmd,
-                shell=True,
+                shell=not direct,
                 cwd=cwd,
+                stdin=subprocess.DEVNULL,
                 stdout=subprocess.DEVNULL,
                 stderr=subprocess.DEVNULL
             )
@@ -326,15 +355,43 @@ class AppLauncher:
 
         Args:
             apps: List of app dictionaries with 'name', 'path', 'arguments', 'working_dir' keys
-            delay_ms: Delay in milliseconds between launching apps
+            delay_ms: Delay in milliseconds between the starts of consecutive launches
             progress_callback: Optional callback(current, total, app_name) for progress updates
 
         Returns:
             List of results with 'name', 'success', and 'error' keys
         """
-        results = []
         total = len(apps)
 
+        if delay_ms <= 0 and total > 1:
+            # Nothing has to wait for the previous spawn, and each Popen
+            # blocks in the OS with the GIL released, so start them together
+            with ThreadPoolExecutor(max_workers=min(32, total)) as executor:
+                futures = []
+                for i, app in enumerate(apps):
+                    if progress_callback:
+                        progress_callback(i + 1, total, app.get("name", "Unknown"))
+                    futures.append(executor.submit(
+                        AppLauncher.launch_app,
+                        app.get("path", ""),
+                        app.get("arguments", ""),
+                        app.get("working_dir", "")
+                    ))
+
+            results = []
+            for app, future in zip(apps, futures):
+                success, error = future.result()
+                results.append({
+                    "name": app.get("name", "Unknown"),
+                    "success": success,
+                    "error": error
+                })
+            return results
+
+        results = []
+        # Space launch starts delay_ms apart; time spent inside launch_app
+        # counts toward the delay instead of adding to it
+        next_start = time.monotonic()
         for i, app in enumerate(apps):
             name = app.get("name", "Unknown")
             path = app.get("path", "")
@@ -354,7 +411,10 @@ class AppLauncher:
 
             # Apply delay between apps (except for the last one)
             if delay_ms > 0 and i < total - 1:
-                time.sleep(delay_ms / 1000.0)
+                next_start += delay_ms / 1000.0
+                remaining = next_start - time.monotonic()
+                if remaining > 0:
+                    time.sleep(remaining)
 
         return results
 
@@ -0,0 +1,87 @@
+"""Item delegates shared by the PyQt6 app lists of FavApp Starter."""
+
+from typing import Optional
+
+from PyQt6.QtWidgets import QApplication, QStyle, QStyledItemDelegate, QStyleOptionViewItem
+from PyQt6.QtCore import Qt, QRect, QSize
+from PyQt6.QtGui import QColor, QFont, QFontMetrics, QPalette
+
+
+class AppTextDelegate(QStyledItemDelegate):
+    """
+    Paints an app row as a bold name (DisplayRole) above a small gray path
+    (UserRole).
+
+    Subclasses that draw more than the text call _draw_text() from their own
+    paint() with the rectangle left over for it.
+    """
+
+    # Fixed row height, so with uniform item sizes the view never measures rows
+    ROW_HEIGHT = 44
+    MARGIN_X = 10
+    LINE_SPACING = 2
+    PATH_PIXEL_SIZE = 10
+
+    def __init__(self, parent=None):
+        """Initialize the delegate with an empty font cache."""
+        super().__init__(parent)
+        # (view font, name font, path font, name metrics, path metrics)
+        self._fonts: Optional[tuple] = None
+
+    def _text_fonts(self, base_font: QFont) -> tuple[QFont, QFont, QFontMetrics, QFontMetrics]:
+        """Return the name/path fonts and metrics, rebuilt only when the view font changes."""
+        if self._fonts is None or self._fonts[0] != base_font:
+            name_font = QFont(base_font)
+            name_font.setBold(True)
+            path_font = QFont(base_font)
+            path_font.setPixelSize(self.PATH_PIXEL_SIZE)
+            self._fonts = (
+                QFont(base_font), name_font, path_font,
+                QFontMetrics(name_font), QFontMetrics(path_font)
+            )
+        return self._fonts[1:]
+
+    def _draw_text(self, painter, opt: QStyleOptionViewItem, rect: QRect, index):
+        """Draw the name and path lines, centered vertically within rect."""
+        selected = bool(opt.state & QStyle.StateFlag.State_Selected)
+        text_color = opt.palette.color(
+            QPalette.ColorRole.HighlightedText if selected else QPalette.ColorRole.Text
+        )
+        name_font, path_font, name_metrics, path_metrics = self._text_fonts(opt.font)
+
+        block_height = name_metrics.height() + self.LINE_SPACING + path_metrics.height()
+        top = rect.top() + (rect.height() - block_height) // 2
+        name_rect = QRect(rect.left(), top, rect.width(), name_metrics.height())
+        path_rect = QRect(
+            rect.left(), name_rect.bottom() + 1 + self.LINE_SPACING,
+            rect.width(), path_metrics.height()
+        )
+        align = Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter
+
+        painter.save()
+        painter.setPen(text_color)
+        painter.setFont(name_font)
+        painter.drawText(name_rect, align, name_metrics.elidedText(
+            index.data(Qt.ItemDataRole.DisplayRole), Qt.TextElideMode.ElideRight, name_rect.width()
+        ))
+        painter.setPen(text_color if selected else QColor("gray"))
+        painter.setFont(path_font)
+        painter.drawText(path_rect, align, path_metrics.elidedText(
+            index.data(Qt.ItemDataRole.UserRole), Qt.TextElideMode.ElideMiddle, path_rect.width()
+        ))
+        painter.restore()
+
+    def paint(self, painter, option, index):
+        """Draw the row background, then the name and path text."""
+        opt = QStyleOptionViewItem(option)
+        self.initStyleOption(opt, index)
+        opt.text = ""
+        widget = opt.widget
+        style = widget.style() if widget else QApplication.style()
+        style.drawControl(QStyle.ControlElement.CE_ItemViewItem, opt, painter, widget)
+
+        self._draw_text(painter, opt, opt.rect.adjusted(self.MARGIN_X, 0, -self.MARGIN_X, 0), index)
+
+    def sizeHint(self, option, index) -> QSize:
+        """Return the fixed row size; the view stretches rows to its width."""
+        return QSize(0, self.ROW_HEIGHT)
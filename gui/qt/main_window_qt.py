@@ -1,33 +1,454 @@
 """PyQt6 main window for FavApp Starter."""
 
 import os
-import sys
-import threading
 from datetime import datetime
-from typing import Optional
+from functools import partial
+from typing import Callable, Optional
 from PIL import Image
 from PyQt6.QtWidgets import (
-    QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
-    QComboBox, QLineEdit, QScrollArea, QCheckBox, QFrame, QMenuBar, QMenu,
-    QSystemTrayIcon
+    QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
+    QComboBox, QLineEdit, QFrame, QMenuBar, QMenu, QSystemTrayIcon,
+    QListView, QStyle, QStyleOptionViewItem, QToolTip,
+    QMessageBox, QFileDialog
+)
+from PyQt6.QtGui import (
+    QIcon, QPixmap, QImage, QAction, QShortcut, QKeySequence, QPainter, QColor, QPen,
+    QPixmapCache
+)
+from PyQt6.QtCore import (
+    Qt, QTimer, pyqtSignal, QEvent, QSize, QRect, QObject, QRunnable, QThreadPool,
+    QAbstractListModel, QModelIndex, QSortFilterProxyModel, QBuffer, QIODevice
 )
-from PyQt6.QtGui import QIcon, QPixmap, QImage, QAction, QShortcut, QKeySequence, QPainter, QColor, QPen
-from PyQt6.QtCore import Qt, QTimer, pyqtSignal, QEvent, QSize
 
 from core.config import ConfigManager
 from core.launcher import AppLauncher, IconExtractor
+from core.icon_cache import IconCache
 from .dialogs_qt import (
     ConfirmDialog, AddProfileDialog, AboutDialog, LicenseDialog,
     EditAppDialog, OptionsDialog, SearchAppsDialog, AddAppDialog
 )
+from .delegates import AppTextDelegate
+from .resources import ASSETS_DIR, app_icon
 from .styles import StyleManager
 
 
+def _pil_to_icon_image(pil_image: Image.Image) -> QImage:
+    """Convert a PIL image to a 40x40 (at most) QImage that owns its pixels."""
+    # Wrap the RGBA bytes in a QImage (bytes_per_line gives the stride)
+    if pil_image.mode != 'RGBA':
+        pil_image = pil_image.convert('RGBA')
+    data = pil_image.tobytes('raw', 'RGBA')
+    qimage = QImage(
+        data,
+        pil_image.width,
+        pil_image.height,
+        4 * pil_image.width,
+        QImage.Format.Format_RGBA8888
+    )
+    # Premultiplied ARGB32 is what the raster engine blends natively, so
+    # painting the pixmap needs no per-draw conversion. The conversion also
+    # detaches the image from `data`.
+    qimage = qimage.convertToFormat(QImage.Format.Format_ARGB32_Premultiplied)
+    # Only the 48px fallback badge (or an odd-sized icon) needs scaling;
+    # keeping the aspect ratio replaces square padding, since the view
+    # centers the pixmap in its 40x40 icon area
+    if qimage.size() != QSize(40, 40):
+        qimage = qimage.scaled(
+            40, 40,
+            Qt.AspectRatioMode.KeepAspectRatio,
+            Qt.TransformationMode.SmoothTransformation
+        )
+    return qimage
+
+
+class _IconLoaderSignals(QObject):
+    """Signals for _IconLoader, since a QRunnable cannot emit them itself."""
+
+    # (app path, QImage or None if the app has no icon)
+    loaded = pyqtSignal(str, object)
+
+
+class _IconLoader(QRunnable):
+    """Pool task that extracts an app's icon off the GUI thread."""
+
+    def __init__(self, path: str, disk_cache: IconCache):
+        """
+        Initialize the task.
+
+        Args:
+            path: Path of the app to extract the icon from
+            disk_cache: Persistent cache checked before extracting
+        """
+        super().__init__()
+        self.path = path
+        self.disk_cache = disk_cache
+        self.signals = _IconLoaderSignals()
+
+    def run(self):
+        """Load or extract the icon and emit it as a QImage (QPixmap is GUI-thread only)."""
+        image = None
+        try:
+            # Key on the normalized path and mtime, so an updated executable
+            # gets its new icon; the stat stays off the GUI thread
+            cache_key = IconCache.make_key(self.path, 40)
+            # An icon (or a failure) stored by an earlier run skips the shell
+            # call entirely; an empty entry marks an app without an icon
+            png = self.disk_cache.get(cache_key)
+            if png:
+                image = QImage.fromData(png, "PNG")
+                if image.isNull():
+                    image = None
+                else:
+                    image = image.convertToFormat(QImage.Format.Format_ARGB32_Premultiplied)
+
+            if png is None:
+                # Extract icon at the display size, so it is resampled only once
+                pil_image = IconExtractor.get_icon(self.path, size=40)
+                if pil_image and pil_image.size[0] > 0 and pil_image.size[1] > 0:
+                    image = _pil_to_icon_image(pil_image)
+                    buffer = QBuffer()
+                    buffer.open(QIODevice.OpenModeFlag.WriteOnly)
+                    if image.save(buffer, "PNG"):
+                        self.disk_cache.put(cache_key, bytes(buffer.data()))
+                else:
+                    self.disk_cache.put(cache_key, b"")
+        except:
+            image = None
+        self.signals.loaded.emit(self.path, image)
+
+
+class _LaunchSignals(QObject):
+    """Signals for _LaunchTask, since a QRunnable cannot emit them itself."""
+
+    # Result dicts from AppLauncher.launch_multiple
+    finished = pyqtSignal(list)
+
+
+class _LaunchTask(QRunnable):
+    """Pool task that launches a list of apps off the GUI thread."""
+
+    def __init__(self, apps: list[dict], delay_ms: int):
+        """
+        Initialize the task.
+
+        Args:
+            apps: Apps to launch
+            delay_ms: Delay in milliseconds between launching apps
+        """
+        super().__init__()
+        # Snapshot on the GUI thread: the config's dicts may be edited or
+        # removed while the pool thread is still launching
+        self.apps = [dict(app) for app in apps]
+        self.delay_ms = delay_ms
+        self.signals = _LaunchSignals()
+
+    def run(self):
+        """Launch the apps and emit their results (queued to the GUI thread)."""
+        self.signals.finished.emit(AppLauncher.launch_multiple(self.apps, self.delay_ms))
+
+
+class _AppListModel(QAbstractListModel):
+    """List model over the active profile's apps, with a check box per row."""
+
+    # Lowercased name and path joined by NUL, so a search cannot match
+    # across the two
+    SEARCH_ROLE = Qt.ItemDataRole.UserRole + 1
+
+    ICON_SIZE = 40
+
+    # Emitted whenever the set of checked rows changes
+    checked_changed = pyqtSignal()
+
+    def __init__(self, icon_provider: Callable[[str], QPixmap], parent=None):
+        """
+        Initialize the model.
+
+        Args:
+            icon_provider: Callable returning the icon pixmap for an app path,
+                or None while the icon is still loading
+            parent: Parent object
+        """
+        super().__init__(parent)
+        self._icon_provider = icon_provider
+        self._apps: list[dict] = []
+        self._search_keys: list[str] = []
+        # Pixmaps already fetched for this set of apps, by row; repaints
+        # then skip the provider
+        self._icons: dict[int, QPixmap] = {}
+        # Rows listing each app path, so a loaded icon repaints only its rows
+        self._path_rows: dict[str, list[int]] = {}
+        self._checked: set[int] = set()
+        self._show_icons = True
+        # Holds the icon space while an icon loads, so the text does not shift
+        self._placeholder_icon = QPixmap(self.ICON_SIZE, self.ICON_SIZE)
+        self._placeholder_icon.fill(Qt.GlobalColor.transparent)
+
+    def set_apps(self, apps: list[dict], show_icons: bool):
+        """Replace the listed apps and clear all check boxes."""
+        self.beginResetModel()
+        # Copy the list: the config's own list changes on add/remove, and
+        # rows must only change between reset (or insert/remove) signals
+        self._apps = list(apps)
+        self._search_keys = [
+            f"{app.get('name', '')}\0{app.get('path', '')}".lower() for app in self._apps
+        ]
+        self._path_rows = {}
+        for row, app in enumerate(self._apps):
+            self._path_rows.setdefault(app.get("path", ""), []).append(row)
+        self._icons.clear()
+        self._checked.clear()
+        self._show_icons = show_icons
+        self.endResetModel()
+        self.checked_changed.emit()
+
+    def app_at(self, row: int) -> dict:
+        """Return the app dict at the given row (its index in the profile)."""
+        return self._apps[row]
+
+    def update_app(self, row: int, app: dict):
+        """Replace one app in place, keeping the other rows, icons and check boxes."""
+        old_path = self._apps[row].get("path", "")
+        new_path = app.get("path", "")
+        if new_path != old_path:
+            rows = self._path_rows[old_path]
+            rows.remove(row)
+            if not rows:
+                del self._path_rows[old_path]
+            self._path_rows.setdefault(new_path, []).append(row)
+        self._apps[row] = app
+        self._search_keys[row] = f"{app.get('name', '')}\0{app.get('path', '')}".lower()
+        self._icons.pop(row, None)
+        index = self.index(row, 0)
+        self.dataChanged.emit(index, index)
+
+    def checked_rows(self) -> list[int]:
+        """Return the rows whose check box is checked."""
+        return list(self._checked)
+
+    def checked_count(self) -> int:
+        """Return how many rows are checked, without copying the rows."""
+        return len(self._checked)
+
+    def refresh_icon(self, path: str):
+        """Repaint the icon of every row for the given app path."""
+        for row in self._path_rows.get(path, ()):
+            self._icons.pop(row, None)
+            index = self.index(row)
+            self.dataChanged.emit(index, index, [Qt.ItemDataRole.DecorationRole])
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        """Return the number of apps (the list has no children)."""
+        return 0 if parent.isValid() else len(self._apps)
+
+    def flags(self, index):
+        """Make rows user-checkable."""
+        return super().flags(index) | Qt.ItemFlag.ItemIsUserCheckable
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        """Return the app name, path line, icon, check state or tooltip."""
+        if not index.isValid():
+            return None
+
+        app = self._apps[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            return app.get("name", "Unknown")
+        if role == Qt.ItemDataRole.UserRole:
+            path_text = app.get("path", "")
+            if app.get("arguments"):
+                path_text += f" {app['arguments']}"
+            return path_text
+        if role == self.SEARCH_ROLE:
+            return self._search_keys[index.row()]
+        if role == Qt.ItemDataRole.DecorationRole:
+            if not self._show_icons:
+                return None
+            icon = self._icons.get(index.row())
+            if icon is None:
+                icon = self._icon_provider(app.get("path", ""))
+                if icon is None:
+                    return self._placeholder_icon
+                self._icons[index.row()] = icon
+            return icon
+        if role == Qt.ItemDataRole.CheckStateRole:
+            return Qt.CheckState.Checked if index.row() in self._checked else Qt.CheckState.Unchecked
+        if role == Qt.ItemDataRole.ToolTipRole:
+            return "Double-click to launch"
+        return None
+
+    def setData(self, index, value, role=Qt.ItemDataRole.EditRole) -> bool:
+        """Record check box toggles."""
+        if not index.isValid() or role != Qt.ItemDataRole.CheckStateRole:
+            return False
+
+        if Qt.CheckState(value) == Qt.CheckState.Checked:
+            self._checked.add(index.row())
+        else:
+            self._checked.discard(index.row())
+        self.dataChanged.emit(index, index, [Qt.ItemDataRole.CheckStateRole])
+        self.checked_changed.emit()
+        return True
+
+    def clear_checks(self):
+        """Uncheck every row."""
+        if not self._checked:
+            return
+        rows = self._checked
+        self._checked = set()
+        for row in rows:
+            index = self.index(row, 0)
+            self.dataChanged.emit(index, index, [Qt.ItemDataRole.CheckStateRole])
+        self.checked_changed.emit()
+
+
+class _AppItemDelegate(AppTextDelegate):
+    """Paints an app row: check box, icon, bold name over gray path, edit button."""
+
+    ROW_HEIGHT = 56
+    BUTTON_SIZE = 35
+    BUTTON_ICON_SIZE = 24
+    BUTTON_COLOR = QColor("#1f538d")
+    PATH_PIXEL_SIZE = 11
+
+    # Emitted with the (view) index whose edit button was clicked
+    edit_requested = pyqtSignal(QModelIndex)
+    # Emitted with the (view) index whose name/path area was double-clicked
+    launch_requested = pyqtSignal(QModelIndex)
+
+    def __init__(self, edit_icon: QIcon, parent=None):
+        """Initialize the delegate with the icon drawn on each edit button."""
+        super().__init__(parent)
+        self._edit_icon = edit_icon
+        # Edit button pre-rendered for the current device pixel ratio
+        self._button_pixmap: Optional[QPixmap] = None
+
+    def _edit_button_pixmap(self, device_pixel_ratio: float) -> QPixmap:
+        """Return the edit button (background and icon), rendered once per pixel ratio."""
+        if (self._button_pixmap is None or
+                self._button_pixmap.devicePixelRatio() != device_pixel_ratio):
+            side = round(self.BUTTON_SIZE * device_pixel_ratio)
+            pixmap = QPixmap(side, side)
+            pixmap.setDevicePixelRatio(device_pixel_ratio)
+            pixmap.fill(Qt.GlobalColor.transparent)
+
+            painter = QPainter(pixmap)
+            painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+            painter.setPen(Qt.PenStyle.NoPen)
+            painter.setBrush(self.BUTTON_COLOR)
+            button_rect = QRect(0, 0, self.BUTTON_SIZE, self.BUTTON_SIZE)
+            painter.drawRoundedRect(button_rect, 6, 6)
+            inset = (self.BUTTON_SIZE - self.BUTTON_ICON_SIZE) // 2
+            self._edit_icon.paint(painter, button_rect.adjusted(inset, inset, -inset, -inset))
+            painter.end()
+
+            self._button_pixmap = pixmap
+        return self._button_pixmap
+
+    def _button_rect(self, rect: QRect) -> QRect:
+        """Return the edit button rectangle for a row."""
+        return QRect(
+            rect.right() - self.MARGIN_X - self.BUTTON_SIZE + 1,
+            rect.top() + (rect.height() - self.BUTTON_SIZE) // 2,
+            self.BUTTON_SIZE, self.BUTTON_SIZE
+        )
+
+    def paint(self, painter, option, index):
+        """Draw the row via the style, then the text and the edit button."""
+        opt = QStyleOptionViewItem(option)
+        self.initStyleOption(opt, index)
+        widget = opt.widget
+        style = widget.style() if widget else QApplication.style()
+
+        text_rect = style.subElementRect(QStyle.SubElement.SE_ItemViewItemText, opt, widget)
+        button_rect = self._button_rect(opt.rect)
+        text_rect.setLeft(text_rect.left() + self.MARGIN_X)
+        text_rect.setRight(button_rect.left() - self.MARGIN_X)
+
+        # Background, check box and icon come from the style
+        opt.text = ""
+        style.drawControl(QStyle.ControlElement.CE_ItemViewItem, opt, painter, widget)
+
+        self._draw_text(painter, opt, text_rect, index)
+        painter.drawPixmap(
+            button_rect.topLeft(),
+            self._edit_button_pixmap(painter.device().devicePixelRatioF())
+        )
+
+    def _check_rect(self, option, index) -> QRect:
+        """Return the check indicator rectangle for a row."""
+        opt = QStyleOptionViewItem(option)
+        self.initStyleOption(opt, index)
+        widget = opt.widget
+        style = widget.style() if widget else QApplication.style()
+        return style.subElementRect(QStyle.SubElement.SE_ItemViewItemCheckIndicator, opt, widget)
+
+    def editorEvent(self, event, model, option, index) -> bool:
+        """Turn edit button clicks into edit_requested and row double-clicks into launch_requested."""
+        if event.type() in (QEvent.Type.MouseButtonPress, QEvent.Type.MouseButtonRelease,
+                            QEvent.Type.MouseButtonDblClick):
+            pos = event.position().toPoint()
+            if self._button_rect(option.rect).contains(pos):
+                if (event.type() == QEvent.Type.MouseButtonRelease and
+                        event.button() == Qt.MouseButton.LeftButton):
+                    self.edit_requested.emit(index)
+                return True
+
+            # The view's doubleClicked also fires on the check box and the
+            # edit button, so launches are decided here instead
+            if (event.type() == QEvent.Type.MouseButtonDblClick and
+                    event.button() == Qt.MouseButton.LeftButton and
+                    not self._check_rect(option, index).contains(pos)):
+                self.launch_requested.emit(index)
+                return True
+        return super().editorEvent(event, model, option, index)
+
+    def helpEvent(self, event, view, option, index) -> bool:
+        """Show the edit button's own tooltip."""
+        if self._button_rect(option.rect).contains(event.pos()):
+            QToolTip.showText(event.globalPos(), "Edit App", view)
+            return True
+        return super().helpEvent(event, view, option, index)
+
+
 class MainWindow(QMainWindow):
     """Main application window using PyQt6."""
 
     APP_VERSION = "26.2.2"
     APP_AUTHOR = "Alexandru Teodorovici"
+    SEARCH_DELAY_MS = 130
+
+    # Button icons by (icon_type, size); QIcon is implicitly shared
+    _BUTTON_ICON_CACHE: dict[tuple[str, int], QIcon] = {}
+    _BUTTON_ICON_DIR = os.path.join(ASSETS_DIR, "icons")
+
+    # Menu bar: (menu title, [(label, shortcut or None, slot name) or None
+    # for a separator])
+    _MENU_SPEC = [
+        ("File", [
+            ("Options", "Ctrl+,", "_show_options"),
+            None,
+            ("Exit", "Ctrl+Q", "close"),
+        ]),
+        ("Profile", [
+            ("New Profile", "Ctrl+N", "_show_add_profile_dialog"),
+            ("Duplicate Profile", "Ctrl+D", "_duplicate_profile"),
+            ("Rename Profile", None, "_rename_profile"),
+            None,
+            ("Export Profile...", None, "_export_profile"),
+            ("Export All Profiles...", None, "_export_all_profiles"),
+            ("Import Profiles...", None, "_import_profiles"),
+        ]),
+        ("About", [
+            ("App Info", None, "_show_about"),
+        ]),
+    ]
+
+    # Window shortcuts without a menu action: (key, slot name). A key that
+    # is also a menu shortcut would be ambiguous and trigger neither.
+    _SHORTCUT_SPEC = (
+        ("Ctrl+A", "_show_add_app_dialog"),
+        ("Ctrl+L", "_launch_all"),
+        ("Delete", "_remove_selected_app"),
+    )
 
     def __init__(self, config: ConfigManager):
         """
@@ -39,9 +460,23 @@ class MainWindow(QMainWindow):
         super().__init__()
 
         self.config = config
-        self.icon_cache = {}
-        self.app_items = []
+        self.icon_disk_cache = IconCache(
+            os.path.join(os.path.dirname(os.path.abspath(config.config_path)), "icon_cache.db")
+        )
+        self._fallback_icons: dict[str, QPixmap] = {}
+        # App paths with an icon load queued on the thread pool
+        self._icon_jobs: set[str] = set()
+        # Launches get their own single-thread pool, so they never queue
+        # behind icon jobs and one launch task sleeps between apps at a time
+        self._launch_pool = QThreadPool(self)
+        self._launch_pool.setMaxThreadCount(1)
         self.tray_icon = None
+        self._tray_menu: Optional[QMenu] = None
+        # Tray profile submenu and the names it was last filled with
+        self._tray_profile_menu: Optional[QMenu] = None
+        self._tray_profile_separator: Optional[QAction] = None
+        self._tray_profile_names: Optional[frozenset[str]] = None
+        self._msg_box: Optional[QMessageBox] = None
 
         # Setup window
         self._setup_window()
@@ -56,6 +491,9 @@ class MainWindow(QMainWindow):
         # Bind shortcuts
         self._bind_shortcuts()
 
+        # Re-theme live when the OS color scheme changes
+        QApplication.styleHints().colorSchemeChanged.connect(self._on_color_scheme_changed)
+
         # Load initial data
         self._refresh_profile_list()
         self._refresh_app_list()
@@ -70,8 +508,8 @@ class MainWindow(QMainWindow):
         if self.config.get_setting("start_minimized", False):
             QTimer.singleShot(200, self._minimize_to_tray)
 
-    @staticmethod
-    def _create_button_icon(icon_type: str, size: int = 24) -> QIcon:
+    @classmethod
+    def _create_button_icon(cls, icon_type: str, size: int = 24) -> QIcon:
         """
         Create a simple icon with proper aspect ratio.
 
@@ -82,6 +520,34 @@ class MainWindow(QMainWindow):
         Returns:
             QIcon with proper aspect ratio
         """
+        key = (icon_type, size)
+        cached = cls._BUTTON_ICON_CACHE.get(key)
+        if cached is not None:
+            return cached
+
+        # Shipped PNGs go through Qt's image reader; draw only if one is missing
+        icon_path = os.path.join(cls._BUTTON_ICON_DIR, f"{icon_type}.png")
+        if os.path.exists(icon_path):
+            icon = QIcon(icon_path)
+        else:
+            icon = QIcon(cls._draw_button_icon(icon_type, size))
+        cls._BUTTON_ICON_CACHE[key] = icon
+        return icon
+
+    @staticmethod
+    def _draw_button_icon(icon_type: str, size: int) -> QPixmap:
+        """
+        Draw a button icon with QPainter.
+
+        Fallback for a missing assets/icons PNG, which were rendered from this code.
+
+        Args:
+            icon_type: Type of icon ('add', 'save', 'duplicate', 'delete', 'edit')
+            size: Icon size in pixels (will be square)
+
+        Returns:
+            QPixmap with the drawn icon
+        """
         pixmap = QPixmap(size, size)
         pixmap.fill(Qt.GlobalColor.transparent)
 
@@ -144,7 +610,7 @@ class MainWindow(QMainWindow):
             painter.drawLine(margin + 3, size - margin - 3, margin + 6, size - margin - 6)
 
         painter.end()
-        return QIcon(pixmap)
+        return pixmap
 
     def _setup_window(self):
         """Set up window properties."""
@@ -154,78 +620,26 @@ class MainWindow(QMainWindow):
 
     def _set_icon(self):
         """Set the application icon."""
-        # Handle both running from source and from .exe
-        if getattr(sys, 'frozen', False):
-            base_dir = sys._MEIPASS
-        else:
-            base_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
-        icon_paths = [
-            os.path.join(base_dir, "assets", "icon.ico"),
-            os.path.join(base_dir, "icon.ico"),
-        ]
-
-        for icon_path in icon_paths:
-            if os.path.exists(icon_path):
-                self.setWindowIcon(QIcon(icon_path))
-                break
+        icon = app_icon()
+        if not icon.isNull():
+            self.setWindowIcon(icon)
 
     def _create_menu(self):
-        """Create the application menu bar."""
+        """Create the application menu bar from _MENU_SPEC."""
         menubar = self.menuBar()
 
-        # File menu
-        file_menu = menubar.addMenu("File")
-
-        options_action = QAction("Options", self)
-        options_action.setShortcut("Ctrl+,")
-        options_action.triggered.connect(self._show_options)
-        file_menu.addAction(options_action)
-
-        file_menu.addSeparator()
-
-        exit_action = QAction("Exit", self)
-        exit_action.setShortcut("Ctrl+Q")
-        exit_action.triggered.connect(self.close)
-        file_menu.addAction(exit_action)
-
-        # Profile menu
-        profile_menu = menubar.addMenu("Profile")
-
-        new_profile_action = QAction("New Profile", self)
-        new_profile_action.setShortcut("Ctrl+N")
-        new_profile_action.triggered.connect(self._show_add_profile_dialog)
-        profile_menu.addAction(new_profile_action)
-
-        duplicate_action = QAction("Duplicate Profile", self)
-        duplicate_action.setShortcut("Ctrl+D")
-        duplicate_action.triggered.connect(self._duplicate_profile)
-        profile_menu.addAction(duplicate_action)
-
-        rename_action = QAction("Rename Profile", self)
-        rename_action.triggered.connect(self._rename_profile)
-        profile_menu.addAction(rename_action)
-
-        profile_menu.addSeparator()
-
-        export_action = QAction("Export Profile...", self)
-        export_action.triggered.connect(self._export_profile)
-        profile_menu.addAction(export_action)
-
-        export_all_action = QAction("Export All Profiles...", self)
-        export_all_action.triggered.connect(self._export_all_profiles)
-        profile_menu.addAction(export_all_action)
-
-        import_action = QAction("Import Profiles...", self)
-        import_action.triggered.connect(self._import_profiles)
-        profile_menu.addAction(import_action)
-
-        # About menu
-        about_menu = menubar.addMenu("About")
-
-        about_action = QAction("App Info", self)
-        about_action.triggered.connect(self._show_about)
-        about_menu.addAction(about_action)
+        for menu_title, entries in self._MENU_SPEC:
+            menu = menubar.addMenu(menu_title)
+            for entry in entries:
+                if entry is None:
+                    menu.addSeparator()
+                    continue
+                label, shortcut, slot_name = entry
+                action = QAction(label, self)
+                if shortcut:
+                    action.setShortcut(shortcut)
+                action.triggered.connect(getattr(self, slot_name))
+                menu.addAction(action)
 
     def _create_main_ui(self):
         """Create main UI."""
@@ -331,10 +745,16 @@ class MainWindow(QMainWindow):
         search_icon.setFixedWidth(30)
         search_layout.addWidget(search_icon)
 
+        # Filter once typing pauses; each keystroke restarts the timer
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(self.SEARCH_DELAY_MS)
+        self._search_timer.timeout.connect(self._on_search_change)
+
         # Search entry
         self.search_entry = QLineEdit()
         self.search_entry.setPlaceholderText("Search apps...")
-        self.search_entry.textChanged.connect(self._on_search_change)
+        self.search_entry.textChanged.connect(self._search_timer.start)
         search_layout.addWidget(self.search_entry)
 
         layout.addLayout(search_layout)
@@ -342,9 +762,9 @@ class MainWindow(QMainWindow):
     def _create_app_list_section(self, layout):
         """Create the application list section."""
         # Frame for the list
-        list_frame = QFrame()
-        list_frame.setFrameShape(QFrame.Shape.StyledPanel)
-        list_layout = QVBoxLayout(list_frame)
+        self.app_list_frame = QFrame()
+        self.app_list_frame.setFrameShape(QFrame.Shape.StyledPanel)
+        list_layout = QVBoxLayout(self.app_list_frame)
         list_layout.setContentsMargins(10, 10, 10, 10)
         list_layout.setSpacing(5)
 
@@ -353,20 +773,38 @@ class MainWindow(QMainWindow):
         apps_label.setStyleSheet("font-weight: bold;")
         list_layout.addWidget(apps_label)
 
-        # Scrollable frame for apps
-        scroll = QScrollArea()
-        scroll.setWidgetResizable(True)
-        scroll.setFrameShape(QFrame.Shape.NoFrame)
-
-        self.app_list_widget = QWidget()
-        self.app_list_layout = QVBoxLayout(self.app_list_widget)
-        self.app_list_layout.setContentsMargins(0, 0, 0, 0)
-        self.app_list_layout.setSpacing(2)
-
-        scroll.setWidget(self.app_list_widget)
-        list_layout.addWidget(scroll)
-
-        layout.addWidget(list_frame)
+        # App list: rows are painted by the delegate, and searching only
+        # changes which source rows the proxy lets through
+        self.app_model = _AppListModel(self._get_app_icon, self)
+        self.app_model.checked_changed.connect(self._update_remove_button)
+
+        self.app_proxy = QSortFilterProxyModel(self)
+        self.app_proxy.setSourceModel(self.app_model)
+        self.app_proxy.setFilterRole(_AppListModel.SEARCH_ROLE)
+        # Search keys are lowercased once per refresh, so the query is
+        # lowercased instead of comparing case-insensitively per row
+        self.app_proxy.setFilterCaseSensitivity(Qt.CaseSensitivity.CaseSensitive)
+
+        app_delegate = _AppItemDelegate(self._create_button_icon('edit', 24), self)
+        app_delegate.edit_requested.connect(self._on_edit_requested)
+        app_delegate.launch_requested.connect(self._on_launch_requested)
+
+        self.app_list_view = QListView()
+        self.app_list_view.setModel(self.app_proxy)
+        self.app_list_view.setItemDelegate(app_delegate)
+        self.app_list_view.setUniformItemSizes(True)
+        self.app_list_view.setIconSize(QSize(_AppListModel.ICON_SIZE, _AppListModel.ICON_SIZE))
+        self.app_list_view.setSelectionMode(QListView.SelectionMode.NoSelection)
+        self.app_list_view.setEditTriggers(QListView.EditTrigger.NoEditTriggers)
+        list_layout.addWidget(self.app_list_view, stretch=1)
+
+        # Shown instead of the list when there is nothing to list
+        self.app_list_empty_label = QLabel()
+        self.app_list_empty_label.setObjectName("grayLabel")
+        self.app_list_empty_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        list_layout.addWidget(self.app_list_empty_label, stretch=1)
+
+        layout.addWidget(self.app_list_frame)
 
     def _create_bottom_section(self, layout):
         """Create bottom section with buttons."""
@@ -430,6 +868,8 @@ class MainWindow(QMainWindow):
         profiles = self.config.get_profiles()
         active_profile = self.config.get_active_profile()
 
+        # Programmatic changes must not reach _on_profile_change; callers
+        # refresh the app list themselves
         self.profile_combo.blockSignals(True)
         self.profile_combo.clear()
         self.profile_combo.addItems(profiles)
@@ -438,200 +878,128 @@ class MainWindow(QMainWindow):
 
     def _refresh_app_list(self):
         """Refresh the application list."""
-        # Clear existing items
-        for item in self.app_items:
-            item.deleteLater()
-        self.app_items.clear()
-
-        # Get apps for current profile
-        apps = self.config.get_apps()
-
-        # Apply search filter
-        search_query = self.search_entry.text().lower()
-        if search_query:
-            apps = [app for app in apps if search_query in app.get("name", "").lower() or
-                    search_query in app.get("path", "").lower()]
-
-        if not apps:
-            # Show empty state
-            empty_text = "No matching apps found." if search_query else "No apps added yet.\nClick 'Add App' to get started."
-            empty_label = QLabel(empty_text)
-            empty_label.setStyleSheet("color: gray;")
-            empty_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            self.app_list_layout.addWidget(empty_label)
-            self.app_items.append(empty_label)
-            self.remove_btn.setEnabled(False)
-            return
-
-        # Create app items
-        for i, app in enumerate(apps):
-            item = self._create_app_item(i, app)
-            self.app_items.append(item)
-            self.app_list_layout.addWidget(item)
-
-        self.app_list_layout.addStretch()
-
-    def _create_app_item(self, index: int, app: dict) -> QFrame:
-        """Create a single app item widget."""
-        name = app.get("name", "Unknown")
-        path = app.get("path", "")
-
-        item_frame = QFrame()
-        item_frame.setFrameShape(QFrame.Shape.StyledPanel)
-        item_layout = QHBoxLayout(item_frame)
-        item_layout.setContentsMargins(10, 8, 10, 8)
-        item_layout.setSpacing(5)
-
-        # Checkbox for selection
-        checkbox = QCheckBox()
-        checkbox.stateChanged.connect(self._update_remove_button)
-        item_layout.addWidget(checkbox)
-
-        # Store data on frame
-        item_frame.checkbox = checkbox
-        item_frame.app_index = index
-        item_frame.app_data = app
-
-        # App icon
-        if self.config.get_setting("show_app_icons", True):
-            icon_label = self._create_app_icon(path)
-            item_layout.addWidget(icon_label)
-
-        # App info
-        info_layout = QVBoxLayout()
-        info_layout.setSpacing(2)
-
-        name_label = QLabel(name)
-        name_label.setStyleSheet("font-weight: bold;")
-        name_label.setCursor(Qt.CursorShape.PointingHandCursor)
-        name_label.setToolTip("Double-click to launch")
-        name_label.mouseDoubleClickEvent = lambda e: self._launch_single_app(app)
-        info_layout.addWidget(name_label)
-
-        path_text = path
-        if app.get("arguments"):
-            path_text += f" {app['arguments']}"
-
-        path_label = QLabel(path_text)
-        path_label.setStyleSheet("color: gray; font-size: 11px;")
-        info_layout.addWidget(path_label)
-
-        item_layout.addLayout(info_layout, stretch=1)
-
-        # Edit button
-        edit_btn = QPushButton()
-        edit_btn.setIcon(self._create_button_icon('edit', 24))
-        edit_btn.setIconSize(QSize(24, 24))
-        edit_btn.setFixedSize(35, 35)
-        edit_btn.setToolTip("Edit App")
-        edit_btn.clicked.connect(lambda: self._edit_app(index, app))
-        item_layout.addWidget(edit_btn)
-
-        return item_frame
-
-    def _create_app_icon(self, path: str) -> QLabel:
-        """Create app icon widget."""
-        # Check cache
-        cache_key = f"{path}_40x40"
-        if cache_key in self.icon_cache:
-            pixmap = self.icon_cache[cache_key]
+        # Repaint once, after both the model reset and any swap between the
+        # list and the empty-state label
+        self.app_list_frame.setUpdatesEnabled(False)
+        try:
+            self.app_model.set_apps(
+                self.config.get_apps(),
+                self.config.get_setting("show_app_icons", True)
+            )
+            self._update_app_list_state()
+        finally:
+            self.app_list_frame.setUpdatesEnabled(True)
+
+    def _update_app_list_state(self):
+        """Show the empty-state message in place of the list when no rows are visible."""
+        has_rows = self.app_proxy.rowCount() > 0
+        if not has_rows:
+            if self.search_entry.text():
+                self.app_list_empty_label.setText("No matching apps found.")
+            else:
+                self.app_list_empty_label.setText("No apps added yet.\nClick 'Add App' to get started.")
+        self.app_list_empty_label.setVisible(not has_rows)
+        self.app_list_view.setVisible(has_rows)
+
+    def _on_launch_requested(self, index: QModelIndex):
+        """Launch the app whose row was double-clicked."""
+        self._launch_single_app(self.app_model.app_at(self.app_proxy.mapToSource(index).row()))
+
+    def _on_edit_requested(self, index: QModelIndex):
+        """Open the edit dialog for the row whose edit button was clicked."""
+        row = self.app_proxy.mapToSource(index).row()
+        self._edit_app(row, self.app_model.app_at(row))
+
+    def _get_app_icon(self, path: str) -> Optional[QPixmap]:
+        """Return the 40x40 icon pixmap for an app, or None while it is being extracted."""
+        # Qt's shared, size-bounded QPixmapCache (10 MB by default) evicts
+        # least-recently-used icons instead of holding every one forever.
+        # It is keyed by path alone; the file stat for the disk cache key
+        # happens in _IconLoader, off the GUI thread
+        pixmap = QPixmapCache.find(f"appicon:{path}")
+        if pixmap is not None:
+            return pixmap
+
+        # Load or extract on the thread pool; _on_icon_loaded fills the cache
+        if path not in self._icon_jobs:
+            self._icon_jobs.add(path)
+            loader = _IconLoader(path, self.icon_disk_cache)
+            loader.signals.loaded.connect(self._on_icon_loaded)
+            QThreadPool.globalInstance().start(loader)
+        return None
+
+    def _on_icon_loaded(self, path: str, image: Optional[QImage]):
+        """Cache an extracted icon (or the fallback) and repaint its rows."""
+        self._icon_jobs.discard(path)
+        if image is None:
+            pixmap = self._get_fallback_icon(path)
         else:
-            pil_image = None
-
-            # Try to extract icon from the file
+            pixmap = QPixmap.fromImage(image)
+        QPixmapCache.insert(f"appicon:{path}", pixmap)
+        self.app_model.refresh_icon(path)
+
+    def _get_fallback_icon(self, path: str) -> QPixmap:
+        """Return the letter badge for an app without an icon, drawing each letter once."""
+        app_name = os.path.basename(path).split('.')[0]
+        letter = app_name[0].upper() if app_name else "?"
+        pixmap = self._fallback_icons.get(letter)
+        if pixmap is not None:
+            return pixmap
+
+        pil_image = Image.new('RGBA', (48, 48), (100, 149, 237, 255))
+        from PIL import ImageDraw, ImageFont
+        draw = ImageDraw.Draw(pil_image)
+        try:
             try:
-                # Extract icon
-                pil_image = IconExtractor.get_icon(path, size=48)
-
-                # Verify the image is valid
-                if pil_image and pil_image.size[0] > 0 and pil_image.size[1] > 0:
-                    pass  # Valid image
-                else:
-                    pil_image = None
+                font = ImageFont.truetype("arial.ttf", 32)
             except:
-                pil_image = None
+                font = ImageFont.load_default()
+            draw.text((24, 24), letter, fill=(255, 255, 255, 255), font=font, anchor="mm")
+        except:
+            pass
 
-            # If extraction failed, create a fallback icon
-            if not pil_image:
-                pil_image = Image.new('RGBA', (48, 48), (100, 149, 237, 255))
-                from PIL import ImageDraw, ImageFont
-                draw = ImageDraw.Draw(pil_image)
-                try:
-                    app_name = os.path.basename(path).split('.')[0]
-                    letter = app_name[0].upper() if app_name else "?"
-                    try:
-                        font = ImageFont.truetype("arial.ttf", 32)
-                    except:
-                        font = ImageFont.load_default()
-                    draw.text((24, 24), letter, fill=(255, 255, 255, 255), font=font, anchor="mm")
-                except:
-                    pass
-
-            # Make the image square by cropping/padding to prevent compression
-            width, height = pil_image.size
-            if width != height:
-                # Create a square canvas with the larger dimension
-                size = max(width, height)
-                square_image = Image.new('RGBA', (size, size), (0, 0, 0, 0))
-                # Paste the original image centered on the canvas
-                x = (size - width) // 2
-                y = (size - height) // 2
-                square_image.paste(pil_image, (x, y))
-                pil_image = square_image
-
-            # Convert PIL Image to QPixmap
-            # Calculate bytes per line for proper stride
-            bytes_per_line = 4 * pil_image.width
-            qimage = QImage(
-                pil_image.tobytes(),
-                pil_image.width,
-                pil_image.height,
-                bytes_per_line,
-                QImage.Format.Format_RGBA8888
-            )
-            pixmap = QPixmap.fromImage(qimage)
-            # Scale to exact size with smooth transformation
-            pixmap = pixmap.scaled(
-                40, 40,
-                Qt.AspectRatioMode.IgnoreAspectRatio,
-                Qt.TransformationMode.SmoothTransformation
-            )
-            self.icon_cache[cache_key] = pixmap
-
-        icon_label = QLabel()
-        icon_label.setPixmap(pixmap)
-        icon_label.setFixedSize(40, 40)
-        return icon_label
+        pixmap = QPixmap.fromImage(_pil_to_icon_image(pil_image))
+        self._fallback_icons[letter] = pixmap
+        return pixmap
 
     def _update_remove_button(self):
         """Update remove button state based on selection."""
-        has_selection = any(
-            hasattr(item, 'checkbox') and item.checkbox.isChecked()
-            for item in self.app_items
-        )
-        self.remove_btn.setEnabled(has_selection)
+        self.remove_btn.setEnabled(self.app_model.checked_count() > 0)
 
     def _on_profile_change(self, profile_name: str):
         """Handle profile selection change."""
-        if profile_name:
+        # Re-selecting the active profile would only re-save and rebuild
+        if profile_name and profile_name != self.config.get_active_profile():
             self.config.set_active_profile(profile_name)
             self._refresh_app_list()
 
     def _on_search_change(self):
-        """Handle search text change."""
-        self._refresh_app_list()
+        """Apply the search text once typing has paused."""
+        previous = self.app_proxy.filterRegularExpression().pattern()
+        self.app_proxy.setFilterFixedString(self.search_entry.text().lower())
+        if self.app_proxy.filterRegularExpression().pattern() != previous:
+            # Rows the filter hides must not stay checked for Remove Selected
+            self.app_model.clear_checks()
+        self._update_app_list_state()
 
     def _show_options(self):
         """Show the options dialog."""
-        def on_theme_change(theme):
-            # Apply theme
-            from PyQt6.QtWidgets import QApplication
-            app = QApplication.instance()
-            stylesheet = StyleManager.get_stylesheet(theme)
+        dialog = OptionsDialog(self, self.config, self._apply_theme)
+        dialog.exec()
+
+    def _apply_theme(self, theme: str):
+        """Apply a theme's stylesheet to the whole application."""
+        app = QApplication.instance()
+        stylesheet = StyleManager.get_stylesheet(theme)
+        # Restyling repolishes every widget; "system" can resolve to
+        # the theme that is already applied
+        if app.styleSheet() != stylesheet:
             app.setStyleSheet(stylesheet)
 
-        dialog = OptionsDialog(self, self.config, on_theme_change)
-        dialog.exec()
+    def _on_color_scheme_changed(self, scheme: Qt.ColorScheme):
+        """Follow the OS light/dark switch while the system theme is selected."""
+        if self.config.get_theme() == "system":
+            self._apply_theme("system")
 
     def _show_about(self):
         """Show the about dialog."""
@@ -704,8 +1072,6 @@ class MainWindow(QMainWindow):
 
     def _export_profile(self):
         """Export current profile as .favapp file."""
-        from PyQt6.QtWidgets import QFileDialog
-
         profile_name = self.config.get_active_profile()
         default_filename = f"{profile_name}.favapp"
 
@@ -727,8 +1093,6 @@ class MainWindow(QMainWindow):
 
     def _export_all_profiles(self):
         """Export all profiles to a single file."""
-        from PyQt6.QtWidgets import QFileDialog
-
         filename, _ = QFileDialog.getSaveFileName(
             self,
             "Export All Profiles",
@@ -745,8 +1109,6 @@ class MainWindow(QMainWindow):
 
     def _import_profiles(self):
         """Import profiles from file (.favapp or .json)."""
-        from PyQt6.QtWidgets import QFileDialog
-
         filename, _ = QFileDialog.getOpenFileName(
             self,
             "Import Profile(s)",
@@ -798,11 +1160,8 @@ class MainWindow(QMainWindow):
 
     def _remove_selected_app(self):
         """Remove selected apps from the current profile."""
-        # Get selected indices in reverse order
-        selected_indices = sorted(
-            [item.app_index for item in self.app_items if hasattr(item, 'checkbox') and item.checkbox.isChecked()],
-            reverse=True
-        )
+        # Get checked indices in reverse order
+        selected_indices = sorted(self.app_model.checked_rows(), reverse=True)
 
         if not selected_indices:
             return
@@ -823,10 +1182,13 @@ class MainWindow(QMainWindow):
         """Show edit dialog for an app."""
         def on_save(name: str, path: str, arguments: str, working_dir: str):
             if self.config.update_app(index, name, path, arguments, working_dir):
-                self._refresh_app_list()
+                # Only this row changed; the proxy re-filters it on dataChanged
+                self.app_model.update_app(index, self.config.get_apps()[index])
+                self._update_app_list_state()
                 self.status_label.setText(f"Updated: {name}")
 
-        dialog = EditAppDialog(self, app_data, on_save)
+        dialog = EditAppDialog(self, app_data)
+        dialog.saved.connect(on_save)
         dialog.exec()
 
     def _launch_single_app(self, app: dict):
@@ -858,69 +1220,65 @@ class MainWindow(QMainWindow):
         self.launch_btn.setEnabled(False)
         self.status_label.setText(f"Launching {len(apps)} apps...")
 
-        def launch_thread():
-            launch_delay = self.config.get_setting("launch_delay", 0)
-            failed = []
-
-            for i, app in enumerate(apps):
-                name = app.get("name", "Unknown")
-                path = app.get("path", "")
-                arguments = app.get("arguments", "")
-                working_dir = app.get("working_dir", "")
-
-                success, error = AppLauncher.launch_app(path, arguments, working_dir)
-
-                if not success:
-                    failed.append(f"{name}: {error}")
-
-                # Delay between launches
-                if i < len(apps) - 1 and launch_delay > 0:
-                    import time
-                    time.sleep(launch_delay / 1000.0)
+        # Launch on the launch pool to avoid blocking UI; launches run
+        # concurrently when there is no delay between apps
+        task = _LaunchTask(apps, self.config.get_setting("launch_delay", 0))
+        task.signals.finished.connect(self._on_launch_finished)
+        self._launch_pool.start(task)
+
+    def _on_launch_finished(self, results: list[dict]):
+        """Report the result of Launch All."""
+        failed = [
+            f"{result['name']}: {result['error']}"
+            for result in results if not result["success"]
+        ]
 
-            # Save last launch time
-            self.config.set_setting("last_launch", datetime.now().isoformat())
+        # Save last launch time; the status line shows the same instant
+        launched_at = datetime.now()
+        self.config.set_setting("last_launch", launched_at.isoformat())
 
-            # Update UI on main thread
-            def update_ui():
-                self.launch_btn.setEnabled(True)
+        self.launch_btn.setEnabled(True)
 
-                if failed:
-                    self.launch_btn.setText("▶  LAUNCH ALL")
-                    self.status_label.setText(f"Failed to launch {len(failed)} app(s)")
-                    self._show_message("Launch Errors", "\n".join(failed))
-                else:
-                    self.launch_btn.setText("✓ Launched!")
-                    self.launch_btn.setStyleSheet("background-color: #1e7a4f; font-size: 14px; font-weight: bold;")
-                    last_launch_time = datetime.now().strftime('%Y-%m-%d %H:%M')
-                    self.status_label.setText(f"Last launch: {last_launch_time}")
-
-                    QTimer.singleShot(1500, lambda: self.launch_btn.setText("▶  LAUNCH ALL"))
-                    QTimer.singleShot(1500, lambda: self.launch_btn.setStyleSheet("font-size: 14px; font-weight: bold;"))
+        if failed:
+            self.launch_btn.setText("▶  LAUNCH ALL")
+            self.status_label.setText(f"Failed to launch {len(failed)} app(s)")
+            self._show_message("Launch Errors", "\n".join(failed))
+        else:
+            self.launch_btn.setText("✓ Launched!")
+            self.launch_btn.setStyleSheet("background-color: #1e7a4f; font-size: 14px; font-weight: bold;")
+            last_launch_time = launched_at.strftime('%Y-%m-%d %H:%M')
+            self.status_label.setText(f"Last launch: {last_launch_time}")
 
-            QTimer.singleShot(0, update_ui)
+            QTimer.singleShot(1500, self._reset_launch_button)
 
-        # Run in thread to avoid blocking UI
-        threading.Thread(target=launch_thread, daemon=True).start()
+    def _reset_launch_button(self):
+        """Restore the Launch All button after the success flash."""
+        self.launch_btn.setText("▶  LAUNCH ALL")
+        self.launch_btn.setStyleSheet("font-size: 14px; font-weight: bold;")
 
     def _show_message(self, title: str, message: str):
         """Show a message dialog."""
-        from PyQt6.QtWidgets import QMessageBox
-        msg_box = QMessageBox(self)
+        # Reuse one box rather than building its widget tree per message;
+        # a second message while it is open gets a box of its own
+        msg_box = self._msg_box
+        if msg_box is None or msg_box.isVisible():
+            msg_box = QMessageBox(self)
+            if self._msg_box is None:
+                self._msg_box = msg_box
+            else:
+                msg_box.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose)
         msg_box.setWindowTitle(title)
         msg_box.setText(message)
         msg_box.setIcon(QMessageBox.Icon.Information)
         msg_box.exec()
 
     def _bind_shortcuts(self):
-        """Bind keyboard shortcuts."""
-        QShortcut(QKeySequence("Ctrl+Q"), self).activated.connect(self.close)
-        QShortcut(QKeySequence("Ctrl+A"), self).activated.connect(self._show_add_app_dialog)
-        QShortcut(QKeySequence("Ctrl+N"), self).activated.connect(self._show_add_profile_dialog)
-        QShortcut(QKeySequence("Ctrl+D"), self).activated.connect(self._duplicate_profile)
-        QShortcut(QKeySequence("Ctrl+L"), self).activated.connect(self._launch_all)
-        QShortcut(QKeySequence("Ctrl+,"), self).activated.connect(self._show_options)
-        QShortcut(QKeySequence("Delete"), self).activated.connect(self._remove_selected_app)
+        """Bind the keyboard shortcuts in _SHORTCUT_SPEC."""
+        self._shortcuts = []
+        for key, slot_name in self._SHORTCUT_SPEC:
+            shortcut = QShortcut(QKeySequence(key), self)
+            shortcut.activated.connect(getattr(self, slot_name))
+            self._shortcuts.append(shortcut)
 
     def _restore_geometry(self):
         """Restore window position and size from config."""
@@ -948,24 +1306,13 @@ class MainWindow(QMainWindow):
         if self.tray_icon:
             return
 
-        # Load icon
-        if getattr(sys, 'frozen', False):
-            base_dir = sys._MEIPASS
-        else:
-            base_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
-        icon_path = os.path.join(base_dir, "assets", "icon.ico")
-        if not os.path.exists(icon_path):
-            icon_path = os.path.join(base_dir, "icon.ico")
-
-        if os.path.exists(icon_path):
-            icon = QIcon(icon_path)
-        else:
-            # Fallback icon
-            icon = QIcon()
+        # No tray to show it in (e.g. some Linux desktops); minimizing then
+        # falls back to a normal minimize since tray_icon stays None
+        if not QSystemTrayIcon.isSystemTrayAvailable():
+            return
 
-        # Create tray icon
-        self.tray_icon = QSystemTrayIcon(icon, self)
+        # Create tray icon (a null icon if the file is missing)
+        self.tray_icon = QSystemTrayIcon(app_icon(), self)
         self.tray_icon.setToolTip("FavApp Starter")
 
         # Create tray menu
@@ -978,11 +1325,11 @@ class MainWindow(QMainWindow):
         self.tray_icon.show()
 
     def _create_tray_menu(self):
-        """Create or update the tray icon menu."""
+        """Create the tray icon menu; only its profile submenu changes later."""
         if not self.tray_icon:
             return
 
-        menu = QMenu()
+        menu = QMenu(self)
 
         # Show action
         show_action = QAction("Show", self)
@@ -991,28 +1338,39 @@ class MainWindow(QMainWindow):
 
         menu.addSeparator()
 
-        # Profile submenu
-        profiles = self.config.get_profiles()
-        if profiles:
-            profile_menu = menu.addMenu("Launch Profiles")
-            for profile_name in sorted(profiles):
-                action = QAction(profile_name, self)
-                action.triggered.connect(lambda checked, p=profile_name: self._launch_profile_from_tray(p))
-                profile_menu.addAction(action)
-
-            menu.addSeparator()
+        # Profile submenu, filled by _refresh_tray_menu
+        self._tray_profile_menu = menu.addMenu("Launch Profiles")
+        self._tray_profile_separator = menu.addSeparator()
 
         # Exit action
         exit_action = QAction("Exit", self)
         exit_action.triggered.connect(self._exit_from_tray)
         menu.addAction(exit_action)
 
+        self._tray_menu = menu
         self.tray_icon.setContextMenu(menu)
+        self._refresh_tray_menu()
 
     def _refresh_tray_menu(self):
         """Refresh the tray icon menu with updated profiles."""
-        if self.tray_icon:
-            self._create_tray_menu()
+        if self._tray_menu is None:
+            return
+
+        # Most edits (apps, settings) leave the profile names untouched;
+        # compare as a set and only sort when the menu must be rebuilt
+        profile_names = frozenset(self.config.get_profiles())
+        if profile_names == self._tray_profile_names:
+            return
+        self._tray_profile_names = profile_names
+
+        self._tray_profile_menu.clear()
+        for profile_name in sorted(profile_names):
+            action = QAction(profile_name, self._tray_profile_menu)
+            action.triggered.connect(partial(self._launch_profile_from_tray, profile_name))
+            self._tray_profile_menu.addAction(action)
+
+        self._tray_profile_menu.menuAction().setVisible(bool(profile_names))
+        self._tray_profile_separator.setVisible(bool(profile_names))
 
     def _on_tray_activated(self, reason):
         """Handle tray icon activation."""
@@ -1034,15 +1392,8 @@ class MainWindow(QMainWindow):
 
     def _launch_profile_from_tray(self, profile_name: str):
         """Launch all apps in a profile from the tray."""
-        # Temporarily switch to the profile
-        original_profile = self.config.get_active_profile()
-        self.config.set_active_profile(profile_name)
-
-        # Get apps for this profile
-        apps = self.config.get_apps()
-
-        # Switch back to original profile
-        self.config.set_active_profile(original_profile)
+        # Read the profile directly; switching to it and back saved the config twice
+        apps = self.config.get_apps(profile_name)
 
         if not apps:
             return
@@ -1057,22 +1408,9 @@ class MainWindow(QMainWindow):
             )
 
         # Launch apps in background
-        def launch_thread():
-            launch_delay = self.config.get_setting("launch_delay", 0)
-
-            for i, app in enumerate(apps):
-                path = app.get("path", "")
-                arguments = app.get("arguments", "")
-                working_dir = app.get("working_dir", "")
-
-                AppLauncher.launch_app(path, arguments, working_dir)
-
-                # Delay between launches
-                if i < len(apps) - 1 and launch_delay > 0:
-                    import time
-                    time.sleep(launch_delay / 1000.0)
-
-        threading.Thread(target=launch_thread, daemon=True).start()
+        self._launch_pool.start(
+            _LaunchTask(apps, self.config.get_setting("launch_delay", 0))
+        )
 
     def _exit_from_tray(self):
         """Exit application from tray."""
@@ -1101,5 +1439,8 @@ class MainWindow(QMainWindow):
             "width": size.width(),
             "height": size.height()
         })
+        self.icon_disk_cache.close()
+        # Let queued launches finish before the process exits
+        self._launch_pool.waitForDone()
 
         event.accept()
@@ -0,0 +1,33 @@
+"""Bundled resources shared by the PyQt6 GUI of FavApp Starter."""
+
+import os
+import sys
+from functools import lru_cache
+
+from PyQt6.QtGui import QIcon
+
+# Resolve the bundle location once at import; it cannot move while the app runs
+if getattr(sys, 'frozen', False):
+    BASE_DIR = sys._MEIPASS
+else:
+    BASE_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+ASSETS_DIR = os.path.join(BASE_DIR, "assets")
+
+
+@lru_cache(maxsize=None)
+def app_icon() -> QIcon:
+    """
+    Return the application icon, decoded once and shared by every window.
+
+    Needs a QApplication, so it is only called once one exists.
+
+    Returns:
+        QIcon of icon.ico, or a null QIcon if the file is missing
+    """
+    # QIcon is null for a missing file, so it doubles as the existence check
+    for icon_path in (os.path.join(ASSETS_DIR, "icon.ico"), os.path.join(BASE_DIR, "icon.ico")):
+        icon = QIcon(icon_path)
+        if not icon.isNull():
+            return icon
+    return QIcon()
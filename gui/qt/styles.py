@@ -23,21 +23,21 @@ class StyleManager:
     @staticmethod
     def _detect_system_theme() -> str:
         """
-        Detect Windows system theme preference.
+        Detect the system theme preference.
 
         Returns:
-            "dark" or "light" based on Windows settings
+            "dark" or "light" based on the platform color scheme
         """
-        try:
-            import winreg
-            key = winreg.OpenKey(
-                winreg.HKEY_CURRENT_USER,
-                r"Software\Microsoft\Windows\CurrentVersion\Themes\Personalize"
-            )
-            value, _ = winreg.QueryValueEx(key, "AppsUseLightTheme")
-            return "light" if value == 1 else "dark"
-        except Exception:
-            return "dark"  # Default to dark if detection fails
+        # Qt tracks the platform color scheme itself, so this is a cached
+        # read rather than a registry query
+        from PyQt6.QtCore import Qt
+        from PyQt6.QtGui import QGuiApplication
+
+        app = QGuiApplication.instance()
+        scheme = app.styleHints().colorScheme() if app else Qt.ColorScheme.Unknown
+        if scheme == Qt.ColorScheme.Light:
+            return "light"
+        return "dark"  # Default to dark if the scheme is unknown
 
     @staticmethod
     def _dark_theme() -> str:
@@ -74,6 +74,11 @@ class StyleManager:
             color: #6a6a6a;
         }
 
+        /* Dialog buttons size to their text with a shared floor */
+        QDialog QPushButton {
+            min-width: 70px;
+        }
+
         /* Green buttons (Save, Launch) */
         QPushButton#saveButton, QPushButton#launchButton {
             background-color: #2fa572;
@@ -188,7 +193,7 @@ class StyleManager:
             spacing: 8px;
         }
 
-        QCheckBox::indicator {
+        QCheckBox::indicator, QListView::indicator {
             width: 18px;
             height: 18px;
             border-radius: 4px;
@@ -200,7 +205,7 @@ class StyleManager:
             border-color: #4a4a4a;
         }
 
-        QCheckBox::indicator:checked {
+        QCheckBox::indicator:checked, QListView::indicator:checked {
             background-color: #1f538d;
             border-color: #1f538d;
         }
@@ -369,6 +374,16 @@ class StyleManager:
             border-radius: 6px;
         }
 
+        /* Item views (app lists) */
+        QListView {
+            background-color: #1a1a1a;
+            border: 2px solid #3a3a3a;
+            border-radius: 6px;
+            selection-background-color: #1f538d;
+            selection-color: white;
+            outline: none;
+        }
+
         /* Status Bar */
         QStatusBar {
             background-color: #1a1a1a;
@@ -421,6 +436,11 @@ class StyleManager:
             color: #8a8a8a;
         }
 
+        /* Dialog buttons size to their text with a shared floor */
+        QDialog QPushButton {
+            min-width: 70px;
+        }
+
         /* Green buttons */
         QPushButton#saveButton, QPushButton#launchButton {
             background-color: #2fa572;
@@ -496,8 +516,18 @@ class StyleManager:
             selection-color: white;
         }
 
+        /* Item views (app lists) */
+        QListView {
+            background-color: white;
+            border: 2px solid #d0d0d0;
+            border-radius: 6px;
+            selection-background-color: #1f538d;
+            selection-color: white;
+            outline: none;
+        }
+
         /* Checkboxes */
-        QCheckBox::indicator {
+        QCheckBox::indicator, QListView::indicator {
             width: 18px;
             height: 18px;
             border-radius: 4px;
@@ -505,7 +535,7 @@ class StyleManager:
             background-color: white;
         }
 
-        QCheckBox::indicator:checked {
+        QCheckBox::indicator:checked, QListView::indicator:checked {
             background-color: #1f538d;
             border-color: #1f538d;
         }
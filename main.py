@@ -15,11 +15,11 @@ import os
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from PyQt6.QtWidgets import QApplication
-from PyQt6.QtGui import QIcon
 from PyQt6.QtCore import QTimer
 from core.config import ConfigManager
 from core.launcher import AppLauncher
 from gui import MainWindow, StyleManager
+from gui.qt.resources import app_icon
 
 
 def main():
@@ -38,10 +38,10 @@ def main():
     app.setApplicationName("FavApp Starter")
     app.setOrganizationName("Alexandru Teodorovici")
 
-    # Set application icon for taskbar
-    icon_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'assets', 'icon.ico')
-    if os.path.exists(icon_path):
-        app.setWindowIcon(QIcon(icon_path))
+    # Set application icon for taskbar (shared with the windows and tray)
+    icon = app_icon()
+    if not icon.isNull():
+        app.setWindowIcon(icon)
 
     # Load configuration
     config = ConfigManager()
@@ -0,0 +1,65 @@
+"""Tests for AppLauncher.launch_app's choice between a direct and a shell launch."""
+
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from core import launcher
+from core.launcher import AppLauncher
+
+
+class LaunchAppShellTest(unittest.TestCase):
+    """An .exe launches without cmd.exe unless its arguments use cmd syntax."""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.exe = os.path.join(self._tmp.name, "app.exe")
+        open(self.exe, "w").close()
+
+        # Pretend to be on Windows and record the Popen call instead of running it
+        name_patch = mock.patch.object(launcher.os, "name", "nt")
+        popen_patch = mock.patch.object(launcher.subprocess, "Popen")
+        name_patch.start()
+        self.popen = popen_patch.start()
+        self.addCleanup(name_patch.stop)
+        self.addCleanup(popen_patch.stop)
+
+    def _shell_used(self, arguments: str) -> bool:
+        success, error = AppLauncher.launch_app(self.exe, arguments)
+        self.assertTrue(success, error)
+        return self.popen.call_args.kwargs["shell"]
+
+    def test_plain_arguments_launch_directly(self):
+        self.assertFalse(self._shell_used(""))
+        self.assertFalse(self._shell_used('--profile "Work" -n'))
+
+    def test_percent_uses_shell(self):
+        self.assertTrue(self._shell_used("%USERPROFILE%\\notes.txt"))
+
+    def test_ampersand_uses_shell(self):
+        self.assertTrue(self._shell_used("-a & start notepad"))
+
+    def test_pipe_uses_shell(self):
+        self.assertTrue(self._shell_used("--list | more"))
+
+    def test_input_redirection_uses_shell(self):
+        self.assertTrue(self._shell_used("< input.txt"))
+
+    def test_output_redirection_uses_shell(self):
+        self.assertTrue(self._shell_used("> output.log"))
+
+    def test_caret_uses_shell(self):
+        self.assertTrue(self._shell_used("--sep ^&"))
+
+    def test_other_extensions_use_shell(self):
+        shortcut = os.path.join(self._tmp.name, "app.lnk")
+        open(shortcut, "w").close()
+        success, error = AppLauncher.launch_app(shortcut)
+        self.assertTrue(success, error)
+        self.assertTrue(self.popen.call_args.kwargs["shell"])
+
+
+if __name__ == "__main__":
+    unittest.main()